@@ -11,41 +11,38 @@ xdg_config="${XDG_CONFIG_HOME:-${HOME}/.config}"
 
 # apt
 if [ "$(id -u)" = 0 ]; then
-    apt-get update 1>/dev/null
+    apt_get() { apt-get "$@"; }
 else
-    sudo apt-get update 1>/dev/null
+    apt_get() { sudo apt-get "$@"; }
 fi
+apt_get update 1>/dev/null
+pkgs=
 for pkg in curl rsync starship vim; do
     if ! command -v "${pkg}" >/dev/null 2>&1; then
-        if [ "$(id -u)" = 0 ]; then
-            apt-get update
-            apt-get install -y "${pkg}"
-        else
-            sudo apt-get update
-            sudo apt-get install -y "${pkg}"
-        fi
+        pkgs="${pkgs} ${pkg}"
     fi
 done
-if [ "$(id -u)" = 0 ]; then
-    apt-get upgrade -y
-    apt-get autoremove -y
-else
-    sudo apt-get upgrade -y
-    sudo apt-get autoremove -y
+if [ -n "${pkgs}" ]; then
+    # shellcheck disable=SC2086
+    apt_get install -y ${pkgs}
 fi
+apt_get upgrade -y
+apt_get autoremove -y
 
 # authorized keys
 auth_keys="${HOME}/.ssh/authorized_keys"
 mkdir -p "$(dirname "${auth_keys}")"
 touch "${auth_keys}"
-for src in "${submodules}/authorized-keys/authorized_keys" "${configs}/authorized-keys-vc.txt"; do
-    while IFS= read -r line; do
-        [ -z "${line}" ] && continue
-        if ! grep -Fxq -- "${line}" "${auth_keys}"; then
-            printf '%s\n' "${line}" >>"${auth_keys}"
-        fi
-    done <"${src}"
+keys_public="${submodules}/authorized-keys/authorized_keys"
+keys_vc="${configs}/authorized-keys-vc.txt"
+for src in "${keys_public}" "${keys_vc}"; do
+    if [ ! -r "${src}" ]; then
+        printf '%s: No such file or not readable\n' "${src}" >&2
+        exit 1
+    fi
 done
+grep -hFvx -f "${auth_keys}" -- "${keys_public}" "${keys_vc}" |
+    awk '$0 != "" && !seen[$0]++' >>"${auth_keys}"
 
 # shell.sh
 text="[ -f \"${configs}/shell.sh\" ] && . \"${configs}/shell.sh\""